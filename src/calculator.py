@@ -4,9 +4,22 @@ from logging_config import setup_logger
 # Set up logging
 logger = setup_logger('calculator', 'calculator.log')
 
+def unit_operation_rate(rate_config):
+    """
+    Return the cost per unit of operation quantity for a single rate entry.
+    Hourly rates are divided by their throughput (e.g. bends/hour) when one is set.
+    """
+    rate = rate_config.get('value', 0.0)
+    if rate_config.get('type') == 'hourly':
+        sub_value = rate_config.get('sub_value', 1.0)
+        if rate_config.get('sub_field') and sub_value:
+            return rate / sub_value
+    return rate
+
 def calculate_cost(part_specs, rates):
     """
     Calculate the total cost for a part based on specifications and rates.
+    part_specs['work_centres'] is a read-only sequence of (work_centre, quantity, sub_option).
     """
     logger.info(f"Calculating cost for part {part_specs['part_id']}")
     try:
@@ -23,17 +36,7 @@ def calculate_cost(part_specs, rates):
             logger.debug(f"Material cost: £{material_cost} (area={area}m², thickness={part_specs['thickness']}mm)")
 
         for wc, qty, sub_option in part_specs['work_centres']:
-            rate_key = f"{wc.lower()}_rate"
-            rate = rates.get(rate_key, {}).get('value', 0.0)
-            if rates.get(rate_key, {}).get('type') == 'hourly':
-                sub_field = rates[rate_key].get('sub_field')
-                sub_value = rates[rate_key].get('sub_value', 1.0)
-                if sub_field and sub_value:
-                    operation_cost = rate * (qty / sub_value) * quantity
-                else:
-                    operation_cost = rate * qty * quantity
-            else:
-                operation_cost = rate * qty * quantity
+            operation_cost = unit_operation_rate(rates.get(f"{wc.lower()}_rate", {})) * qty * quantity
             total_cost += operation_cost
             logger.debug(f"Operation cost for {wc} ({sub_option}): £{operation_cost} (qty={qty})")
 
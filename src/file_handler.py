@@ -2,6 +2,7 @@ import json
 import os
 import logging
 from logging_config import setup_logger
+from utils import file_mtime, invalidate_caches
 
 # Set up logging
 logger = setup_logger('file_handler', 'file_handler.log')
@@ -14,16 +15,33 @@ class FileHandler:
         self.rates_file = os.path.join(BASE_DIR, 'data', 'rates.json')
         self.output_file = os.path.join(BASE_DIR, 'data', 'output.txt')
         self.quotes_file = os.path.join(BASE_DIR, 'data', 'quotes.txt')
+        self._rates = None
+        self._rates_mtime = None
+        self._users = None
+        self._users_mtime = None
         logger.info("FileHandler initialized")
 
+    def _load_users(self):
+        """
+        Read users.json, reusing the last result until the file's mtime changes.
+        """
+        mtime = file_mtime(self.users_file)
+        if self._users is not None and mtime == self._users_mtime:
+            logger.debug("Using cached users")
+            return self._users
+        with open(self.users_file, 'r', encoding='utf-8') as f:
+            users = json.load(f)
+        self._users = users
+        self._users_mtime = mtime
+        return users
+
     def validate_credentials(self, username, hashed_password):
         """
         Validate user credentials against users.json.
         """
         logger.info(f"Validating credentials for username: {username}")
         try:
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                users = json.load(f)
+            users = self._load_users()
             if username in users and users[username]['password'] == hashed_password:
                 logger.info(f"Credentials validated for {username}")
                 return True
@@ -42,8 +60,7 @@ class FileHandler:
         """
         logger.info(f"Retrieving role for username: {username}")
         try:
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                users = json.load(f)
+            users = self._load_users()
             role = users.get(username, {}).get('role')
             logger.debug(f"Role for {username}: {role}")
             return role
@@ -56,13 +73,19 @@ class FileHandler:
 
     def load_rates(self):
         """
-        Load rates from rates.json.
+        Load rates from rates.json, reusing the last result until the file's mtime changes.
         """
+        mtime = file_mtime(self.rates_file)
+        if self._rates is not None and mtime == self._rates_mtime:
+            logger.debug("Using cached rates")
+            return self._rates
         logger.info("Loading rates")
         try:
             with open(self.rates_file, 'r', encoding='utf-8') as f:
                 rates = json.load(f)
             logger.debug(f"Loaded {len(rates)} rates")
+            self._rates = rates
+            self._rates_mtime = mtime
             return rates
         except FileNotFoundError:
             logger.error(f"Rates file not found: {self.rates_file}")
@@ -80,6 +103,7 @@ class FileHandler:
             with open(self.output_file, 'a', encoding='utf-8') as f:
                 work_centres_str = ";".join([f"{wc[0]}:{wc[1]}:{wc[2]}" for wc in work_centres])
                 f.write(f"{part_id},{revision},{material},{thickness},{length},{width},{quantity},{total_cost},{fastener_types},{work_centres_str}\n")
+            invalidate_caches()
             logger.debug(f"Output saved for {part_id}")
         except Exception as e:
             logger.error(f"Error saving output: {e}")
@@ -111,12 +135,14 @@ class FileHandler:
             users[username] = {'password': hashed_password, 'role': role}
             with open(self.users_file, 'w', encoding='utf-8') as f:
                 json.dump(users, f, indent=4)
+            self._users = None
             logger.debug(f"User {username} created with role {role}")
         except FileNotFoundError:
             logger.error(f"Users file not found: {self.users_file}")
             users = {username: {'password': hashed_password, 'role': role}}
             with open(self.users_file, 'w', encoding='utf-8') as f:
                 json.dump(users, f, indent=4)
+            self._users = None
             logger.debug(f"Created users file with user {username}")
         except Exception as e:
             logger.error(f"Error creating user: {e}")
@@ -136,6 +162,7 @@ class FileHandler:
             del users[username]
             with open(self.users_file, 'w', encoding='utf-8') as f:
                 json.dump(users, f, indent=4)
+            self._users = None
             logger.debug(f"User {username} removed")
         except FileNotFoundError:
             logger.error(f"Users file not found: {self.users_file}")
@@ -150,8 +177,7 @@ class FileHandler:
         """
         logger.info("Retrieving all usernames")
         try:
-            with open(self.users_file, 'r', encoding='utf-8') as f:
-                users = json.load(f)
+            users = self._load_users()
             usernames = list(users.keys())
             logger.debug(f"Retrieved {len(usernames)} usernames")
             return usernames
@@ -168,16 +194,22 @@ class FileHandler:
         """
         logger.info(f"Updating rate {rate_key}")
         try:
-            with open(self.rates_file, 'r', encoding='utf-8') as f:
-                rates = json.load(f)
+            if self._rates is not None and file_mtime(self.rates_file) == self._rates_mtime:
+                rates = self._rates
+            else:
+                with open(self.rates_file, 'r', encoding='utf-8') as f:
+                    rates = json.load(f)
             if rate_key not in rates:
                 logger.error(f"Rate key {rate_key} not found")
                 raise ValueError("Rate key not found")
-            rates[rate_key]['value'] = rate_value
+            rates = dict(rates)
+            rates[rate_key] = dict(rates[rate_key], value=rate_value)
             if sub_value is not None:
                 rates[rate_key]['sub_value'] = sub_value
             with open(self.rates_file, 'w', encoding='utf-8') as f:
                 json.dump(rates, f, indent=4)
+            self._rates = rates
+            self._rates_mtime = file_mtime(self.rates_file)
             logger.debug(f"Rate {rate_key} updated to {rate_value}{f', sub_value={sub_value}' if sub_value else ''}")
         except FileNotFoundError:
             logger.error(f"Rates file not found: {self.rates_file}")
@@ -1,12 +1,13 @@
 import tkinter as tk
 from tkinter import messagebox, Toplevel, ttk
+import tkinter.font as tkfont
 import os
-import json
+import sys
 import logging
 import time
+from functools import partial
 from file_handler import FileHandler
-from logger import log_message
-from PIL import Image, ImageTk
+from logger import log_message, flush_logs
 from utils import hash_password, load_existing_parts, load_parts_catalogue, load_part_cost, handle_errors
 from logic import calculate_and_save, generate_quote, update_rate, create_user, remove_user
 from logging_config import setup_logger
@@ -15,6 +16,25 @@ logger = setup_logger('gui', 'gui.log')
 TESTING_MODE = os.environ.get('TESTING_MODE', '0') == '1'
 logger.debug(f"TESTING_MODE: {TESTING_MODE}")
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ICON_PATH = os.path.join(BASE_DIR, 'docs/images/laser_gear.ico')
+WORK_CENTRES = ("", "Cutting", "Bending", "Welding", "Assembly", "Finishing", "Drilling", "Punching", "Grinding", "Coating", "Inspection")
+MATERIALS = ("Mild Steel", "Aluminium", "Stainless Steel")
+THICKNESSES = ("1.0", "1.2", "1.5", "2.0", "2.5", "3.0")
+LAY_FLAT_LENGTHS = ("50", "100", "500", "1000", "1500", "2000", "3000")
+LAY_FLAT_WIDTHS = ("50", "100", "500", "1000", "1500")
+QUANTITIES = ("1", "5", "10", "20", "50", "100", "Other")
+SUB_PART_QUANTITIES = ("1", "2", "3", "4", "5", "6", "7", "8", "9", "10")
+WELDMENT_OPTIONS = ("Yes", "No")
+ROLES = ("User", "Admin")
+STATUS_CLEAR_MS = 2500
+HELP_GUIDE = (
+    "Sheet Metal Client Hub - User Guide\n\n"
+    "1. Login: Use username/password (e.g., laurie:moffat123, admin:admin123). Check data/users.json if issues.\n"
+    "2. Part Input: Enter part/assembly details, select materials, fasteners, WorkCentre operations.\n"
+    "3. Quote: Generate quotes with customer name and profit margin.\n"
+    "4. Admin: Manage users and rates. Rates stored in data/rates.json.\n"
+    "Support: [support email]."
+)
 
 class SheetMetalClientHub:
     def __init__(self, root):
@@ -26,10 +46,18 @@ class SheetMetalClientHub:
         self.root.title("Sheet Metal Client Hub")
         self.root.geometry("1000x750")
         self.root.minsize(1050, 800)
-        try:
-            self.root.iconbitmap(os.path.join(BASE_DIR, 'docs/images/laser_gear.ico'))
-        except tk.TclError:
-            logger.warning("Could not load laser_gear.ico")
+        # Tk only takes .ico files as window icons on Windows; elsewhere the call can only fail
+        if sys.platform == 'win32':
+            try:
+                self.root.iconbitmap(ICON_PATH)
+            except tk.TclError:
+                logger.warning("Could not load laser_gear.ico")
+        self.font_small = tkfont.Font(root=self.root, family="Arial", size=10)
+        self.font_body = tkfont.Font(root=self.root, family="Arial", size=12)
+        self.font_bold = tkfont.Font(root=self.root, family="Arial", size=12, weight="bold")
+        self.font_heading = tkfont.Font(root=self.root, family="Arial", size=14, weight="bold")
+        self.font_title = tkfont.Font(root=self.root, family="Arial", size=16, weight="bold")
+        self._logo_photo = self._load_logo()
         self.file_handler = FileHandler()
         self.role = None
         self.single_selected_sub_parts = []
@@ -51,36 +79,87 @@ class SheetMetalClientHub:
         self.single_lay_flat_length_var = tk.StringVar(value="1000")
         self.single_lay_flat_width_var = tk.StringVar(value="500")
         self.single_weldment_var = tk.StringVar(value="No")
+        self.rate_key_var = tk.StringVar(value="Select Rate Key")
+        self.rate_value_var = tk.StringVar()
+        self.rate_sub_value_var = tk.StringVar()
+        self.new_username_var = tk.StringVar()
+        self.new_password_var = tk.StringVar()
+        self.new_role_var = tk.StringVar(value="User")
+        self.edit_username_var = tk.StringVar(value="Select User")
+        self.remove_username_var = tk.StringVar(value="Select User")
+        self.status_var = tk.StringVar()
+        self._status_clear_id = None
         self.last_clear_time = 0
         self.clear_debounce_interval = 0.5
+        self._suspend_traces = False
+        self._sub_parts_sources = {}
+        self._admin_dialog = None
+        self._screens = {}
+        self._current_screen = None
+        self._role_screens = {"User": self.create_part_input_screen, "Admin": self.create_admin_screen}
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after_idle(self._warm_caches)
+        self.footer = self.create_footer(self.root)
         self.create_login_screen()
 
-    def show_message(self, title, message, level='info'):
+    def _on_close(self):
+        logger.info("Closing application")
+        flush_logs()
+        self.root.destroy()
+
+    def _warm_caches(self):
+        logger.debug("Warming rates, catalogue and parts caches")
+        self.file_handler.load_rates()
+        load_parts_catalogue()
+        load_existing_parts()
+
+    def show_message(self, title, message, level='info', modal=False):
         logger.debug(f"Show message: {title}")
         if TESTING_MODE:
             log_message(title=title, message=message, level=level)
+        elif not modal and (level == 'info' or self._current_screen is not None and self._current_screen is self._screens.get('part_input')):
+            self._set_status(message, level)
         else:
             messagebox.showinfo(title, message) if level == 'info' else messagebox.showerror(title, message)
         logger.log(logging.INFO if level == 'info' else logging.ERROR, f"{title}: {message}")
 
+    def _set_status(self, message, level='info'):
+        if self._status_clear_id is not None:
+            self.root.after_cancel(self._status_clear_id)
+            self._status_clear_id = None
+        self.status_var.set(message.replace("\n", " "))
+        self.status_label.config(fg="#28a745" if level == 'info' else "#dc3545")
+        if message and level == 'info':
+            self._status_clear_id = self.root.after(STATUS_CLEAR_MS, self._clear_status)
+
+    def _clear_status(self):
+        self._status_clear_id = None
+        self.status_var.set("")
+
     def _create_header(self, parent, title):
         frame = tk.Frame(parent, bg="#f0f0f0")
         frame.pack(side=tk.TOP, fill="x", padx=10, pady=(10, 10))
-        tk.Label(frame, text=title, font=("Arial", 16, "bold"), bg="#f0f0f0").pack(pady=5)
+        tk.Label(frame, text=title, font=self.font_title, bg="#f0f0f0").pack(pady=5)
+        if self._logo_photo is not None:
+            tk.Label(frame, image=self._logo_photo, bg="#f0f0f0").pack(pady=5)
+        else:
+            tk.Label(frame, text="[Logo]", font=self.font_small, bg="#f0f0f0").pack(pady=5)
+        return frame
+
+    def _load_logo(self):
         try:
+            from PIL import Image, ImageTk
             image = Image.open(os.path.join(BASE_DIR, 'docs/images/laser_gear.png')).resize((32, 32), Image.LANCZOS)
             photo = ImageTk.PhotoImage(image)
-            label = tk.Label(frame, image=photo, bg="#f0f0f0")
-            label.image = photo
-            label.pack(pady=5)
             logger.debug("Loaded laser_gear.png")
+            return photo
+        except ImportError:
+            logger.warning("Pillow not installed, showing text logo")
         except FileNotFoundError:
             logger.warning("laser_gear.png not found")
-            tk.Label(frame, text="[Logo]", font=("Arial", 10), bg="#f0f0f0").pack(pady=5)
         except Exception as e:
             logger.error(f"Error loading logo: {e}")
-            tk.Label(frame, text="[Logo]", font=("Arial", 10), bg="#f0f0f0").pack(pady=5)
-        return frame
+        return None
 
     def _create_panel(self, parent, place=False, **kwargs):
         frame = tk.Frame(parent, bg="#e8ecef", bd=1, relief=tk.SOLID, **kwargs)
@@ -90,41 +169,47 @@ class SheetMetalClientHub:
             frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         return frame
 
-    def _create_styled_button(self, parent, text, command, style='action', width=15):
+    def _create_styled_button(self, parent, text, command, style='action', width=15, disable_while_running=False):
         colors = {'action': '#28a745', 'destructive': '#dc3545', 'navigation': '#007bff', 'edit': '#ffc107'}
         bg = colors.get(style, '#28a745')
-        btn = tk.Button(parent, text=text, command=command, font=("Arial", 12), bg=bg, fg="#ffffff", width=width)
+        btn = tk.Button(parent, text=text, command=command, font=self.font_body, bg=bg, fg="#ffffff", width=width)
+        if disable_while_running:
+            btn.config(command=partial(self._run_disabled, btn, command))
         return btn
 
-    def create_footer(self):
+    def _run_disabled(self, button, action):
+        button.config(state='disabled')
+        try:
+            action()
+        finally:
+            self.root.after_idle(partial(button.config, state='normal'))
+
+    def create_footer(self, parent):
         logger.debug("Creating footer")
-        footer = tk.Frame(self.root, bg="lightgrey")
+        footer = tk.Frame(parent, bg="lightgrey")
         footer.pack(side=tk.BOTTOM, fill="x")
-        tk.Label(footer, text="Version 1.0", font=("Arial", 10), bg="lightgrey").pack(side=tk.LEFT, padx=10, pady=5)
-        tk.Button(footer, text="Help", command=self.show_help, font=("Arial", 10), bg="lightgrey").pack(side=tk.RIGHT, padx=10, pady=5)
+        tk.Label(footer, text="Version 1.0", font=self.font_small, bg="lightgrey").pack(side=tk.LEFT, padx=10, pady=5)
+        tk.Button(footer, text="Help", command=self.show_help, font=self.font_small, bg="lightgrey").pack(side=tk.RIGHT, padx=10, pady=5)
+        self.status_label = tk.Label(footer, textvariable=self.status_var, font=self.font_small, bg="lightgrey", anchor="w")
+        self.status_label.pack(side=tk.LEFT, padx=10, fill="x", expand=True)
+        return footer
 
     def show_help(self):
         logger.info("Displaying help guide")
-        guide = (
-            "Sheet Metal Client Hub - User Guide\n\n"
-            "1. Login: Use username/password (e.g., laurie:moffat123, admin:admin123). Check data/users.json if issues.\n"
-            "2. Part Input: Enter part/assembly details, select materials, fasteners, WorkCentre operations.\n"
-            "3. Quote: Generate quotes with customer name and profit margin.\n"
-            "4. Admin: Manage users and rates. Rates stored in data/rates.json.\n"
-            "Support: [support email]."
-        )
-        self.show_message("Help", guide, 'info')
+        self.show_message("Help", HELP_GUIDE, 'info', modal=True)
 
     def create_widget_pair(self, parent, label_text, widget_type, row, col=0, options=None, textvariable=None, default=None, state='normal'):
-        tk.Label(parent, text=label_text, font=("Arial", 12), bg="#e8ecef").grid(row=row, column=col, sticky="e", padx=(10, 2), pady=2)
+        tk.Label(parent, text=label_text, font=self.font_body, bg="#e8ecef").grid(row=row, column=col, sticky="e", padx=(10, 2), pady=2)
         if widget_type == tk.Entry:
-            widget = tk.Entry(parent, font=("Arial", 12), textvariable=textvariable, state=state)
+            widget = tk.Entry(parent, font=self.font_body, textvariable=textvariable, state=state)
             if default:
                 widget.insert(0, default)
         elif widget_type == tk.OptionMenu:
             widget = tk.OptionMenu(parent, textvariable, *options)
+        elif widget_type == ttk.Combobox:
+            widget = ttk.Combobox(parent, font=self.font_body, textvariable=textvariable, values=options, state=state)
         elif widget_type == tk.Listbox:
-            widget = tk.Listbox(parent, font=("Arial", 12), height=options.get('height', 5), width=options.get('width', 40))
+            widget = tk.Listbox(parent, font=self.font_body, height=options.get('height', 5), width=options.get('width', 40))
         widget.grid(row=row, column=col+1, sticky="w", padx=(2, 5), pady=2)
         return widget
 
@@ -134,18 +219,26 @@ class SheetMetalClientHub:
 
     def create_login_screen(self):
         logger.info("Creating login screen")
-        self.clear_screen()
-        self._create_header(self.root, "Login")
-        main_frame = self._create_panel(self.root, place=True)
+        self._show_screen('login', self._build_login_screen, self._reset_login_screen)
+
+    def _build_login_screen(self, screen):
+        self._create_header(screen, "Login")
+        main_frame = self._create_panel(screen, place=True)
         self.username_entry = self.create_widget_pair(main_frame, "Username:", tk.Entry, row=0)
         self.username_entry.focus_set()
         self.password_entry = self.create_widget_pair(main_frame, "Password:", tk.Entry, row=1)
         self.password_entry.config(show="*")
-        self._create_styled_button(main_frame, "Login", self.login).grid(row=2, column=0, padx=5, pady=10)
+        self.login_button = self._create_styled_button(main_frame, "Login", self.login, disable_while_running=True)
+        self.login_button.grid(row=2, column=0, padx=5, pady=10)
         self._create_styled_button(main_frame, "Clear", lambda: self.clear_fields([(self.username_entry, ""), (self.password_entry, "")], "Clearing login fields", "FR1"), style='navigation').grid(row=2, column=1, padx=5, pady=10)
-        self.root.bind('<Return>', lambda event: self.login())
+        for entry in (self.username_entry, self.password_entry):
+            # Through the button, so Return presses made while a login is running are dropped too
+            entry.bind('<Return>', lambda event: self.login_button.invoke())
         self._configure_grid(main_frame)
-        self.create_footer()
+
+    def _reset_login_screen(self):
+        self.clear_fields([(self.username_entry, ""), (self.password_entry, "")], "Resetting login screen", "FR1")
+        self.username_entry.focus_set()
 
     def clear_fields(self, field_pairs, log_msg, test_case):
         logger.info(log_msg)
@@ -176,30 +269,21 @@ class SheetMetalClientHub:
             logger.error(f"Hash failed for {username}")
             raise ValueError("Error processing password")
         
-        try:
-            users_file = os.path.join(BASE_DIR, 'data', 'users.json')
-            if not os.path.exists(users_file):
-                logger.error(f"Users file missing: {users_file}")
-                raise FileNotFoundError("Users file not found")
-            with open(users_file, 'r', encoding='utf-8') as f:
-                users = json.load(f)
-            if self.file_handler.validate_credentials(username, hashed_password):
-                self.role = self.file_handler.get_user_role(username)
-                if not self.role:
-                    logger.error(f"No role for {username}")
-                    raise ValueError("User role not found")
-                logger.info(f"Login successful as {self.role}")
-                if self.role == "User":
-                    self.create_part_input_screen()
-                else:
-                    self.create_admin_screen()
-                return f"Login successful as {self.role}"
-            else:
-                logger.error(f"Invalid credentials for {username}")
-                raise ValueError("Invalid username or password")
-        except Exception as e:
-            logger.error(f"Login error: {e}")
-            raise ValueError(f"Authentication error: {str(e)}")
+        users_file = os.path.join(BASE_DIR, 'data', 'users.json')
+        if not os.path.exists(users_file):
+            logger.error(f"Users file missing: {users_file}")
+            raise ValueError("Users file not found")
+        if not self.file_handler.validate_credentials(username, hashed_password):
+            logger.error(f"Invalid credentials for {username}")
+            raise ValueError("Invalid username or password")
+        self.role = self.file_handler.get_user_role(username)
+        show_role_screen = self._role_screens.get(self.role)
+        if show_role_screen is None:
+            logger.error(f"No usable role for {username}: {self.role!r}")
+            raise ValueError("User role not found")
+        logger.info(f"Login successful as {self.role}")
+        show_role_screen()
+        return f"Login successful as {self.role}"
 
     def prompt_admin_create(self):
         logger.info("Prompting admin credentials")
@@ -207,50 +291,69 @@ class SheetMetalClientHub:
             log_message(title='Admin', message='Bypassing admin prompt', level='info')
             return True
 
-        dialog = tk.Toplevel(self.root)
+        if self._admin_dialog is None:
+            self._build_admin_dialog()
+        self._admin_dialog_result.set("pending")
+        self.clear_fields([(self.admin_username_entry, ""), (self.admin_password_entry, "")], "Resetting admin prompt", "Admin Prompt")
+        self._admin_dialog.deiconify()
+        self._admin_dialog.grab_set()
+        self.admin_username_entry.focus_set()
+        self.root.wait_variable(self._admin_dialog_result)
+        return self._admin_dialog_result.get() == "valid"
+
+    def _build_admin_dialog(self):
+        dialog = self._admin_dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Admin Login")
         dialog.geometry("400x300")
         dialog.transient(self.root)
-        dialog.grab_set()
+        self._admin_dialog_result = tk.StringVar(value="pending")
 
         self._create_header(dialog, "Admin Login")
         main_frame = self._create_panel(dialog)
-        username_entry = self.create_widget_pair(main_frame, "Admin Username:", tk.Entry, row=0)
-        username_entry.focus_set()
-        password_entry = self.create_widget_pair(main_frame, "Admin Password:", tk.Entry, row=1)
-        password_entry.config(show="*")
-
-        result = {"valid": False}
-
-        def validate():
-            username = username_entry.get().strip()
-            password = password_entry.get().strip()
-            if not username or not password:
-                self.show_message("Error", "Credentials cannot be empty", 'error')
-                return
-            hashed_password = hash_password(password)
-            if not hashed_password:
-                logger.error(f"Hash failed for {username}")
-                self.show_message("Error", "Error processing credentials", 'error')
-                return
-            try:
-                if self.file_handler.validate_credentials(username, hashed_password) and self.file_handler.get_user_role(username) == "Admin":
-                    logger.info(f"Admin validated: {username}")
-                    result["valid"] = True
-                    dialog.destroy()
-                else:
-                    logger.error(f"Invalid admin credentials: {username}")
-                    self.show_message("Error", "Invalid admin credentials", 'error')
-            except Exception as e:
-                logger.error(f"Validation error: {e}")
-                self.show_message("Error", f"Authentication error: {str(e)}", 'error')
-
-        self._create_styled_button(main_frame, "Submit", validate).grid(row=2, column=0, padx=5, pady=10)
-        self._create_styled_button(main_frame, "Cancel", dialog.destroy, style='navigation').grid(row=2, column=1, padx=5, pady=10)
-        dialog.bind('<Return>', lambda event: validate())
+        self.admin_username_entry = self.create_widget_pair(main_frame, "Admin Username:", tk.Entry, row=0)
+        self.admin_password_entry = self.create_widget_pair(main_frame, "Admin Password:", tk.Entry, row=1)
+        self.admin_password_entry.config(show="*")
+
+        self._create_styled_button(main_frame, "Submit", self._validate_admin_dialog).grid(row=2, column=0, padx=5, pady=10)
+        self._create_styled_button(main_frame, "Cancel", partial(self._close_admin_dialog, "cancelled"), style='navigation').grid(row=2, column=1, padx=5, pady=10)
+        dialog.bind('<Return>', lambda event: self._validate_admin_dialog())
+        dialog.protocol("WM_DELETE_WINDOW", partial(self._close_admin_dialog, "cancelled"))
         self._configure_grid(main_frame)
-        self.root.wait_window(dialog)
-        return result["valid"]
+
+    def _close_admin_dialog(self, result):
+        self._admin_dialog.grab_release()
+        self._admin_dialog.withdraw()
+        self._admin_dialog_result.set(result)
+
+    def _validate_admin_dialog(self):
+        username = self.admin_username_entry.get().strip()
+        password = self.admin_password_entry.get().strip()
+        if not username or not password:
+            self.show_message("Error", "Credentials cannot be empty", 'error', modal=True)
+            return
+        hashed_password = hash_password(password)
+        if not hashed_password:
+            logger.error(f"Hash failed for {username}")
+            self.show_message("Error", "Error processing credentials", 'error', modal=True)
+            return
+        try:
+            if self.file_handler.validate_credentials(username, hashed_password) and self.file_handler.get_user_role(username) == "Admin":
+                logger.info(f"Admin validated: {username}")
+                self._close_admin_dialog("valid")
+            else:
+                logger.error(f"Invalid admin credentials: {username}")
+                self.show_message("Error", "Invalid admin credentials", 'error', modal=True)
+        except Exception as e:
+            logger.error(f"Validation error: {e}")
+            self.show_message("Error", f"Authentication error: {str(e)}", 'error', modal=True)
+
+    def _on_quantity_selected(self, event):
+        self.update_quantity_entry_state()
+
+    def _on_single_items_changed(self, *args):
+        if not self._suspend_traces:
+            self.update_selected_items(1)
 
     def update_quantity_entry_state(self):
         logger.debug("Updating quantity entry state")
@@ -262,31 +365,44 @@ class SheetMetalClientHub:
         logger.debug(f"Updating sub-parts dropdown: tab {tab_index}")
         var, option = (self.single_sub_parts_var, self.single_sub_parts_option) if tab_index == 1 else (self.assembly_sub_parts_var, self.assembly_sub_parts_option)
         var.set("Select Item")
-        menu = option['menu']
-        menu.delete(0, tk.END)
-        menu.add_command(label="Select Item", command=lambda: var.set("Select Item"))
         items = load_parts_catalogue() if tab_index == 1 else load_existing_parts()
+        if self._sub_parts_sources.get(tab_index) is items:
+            return
+        self._sub_parts_sources[tab_index] = items
         if tab_index == 1:
-            for item_id, desc, price in items or []:
-                label = f"{item_id}: {desc}"
-                menu.add_command(label=label, command=lambda x=label: var.set(x))
+            labels = [f"{item_id}: {desc}" for item_id, desc, price in items]
         else:
-            for item in items or []:
-                menu.add_command(label=item, command=lambda x=item: var.set(x))
-        if not items:
-            menu.add_command(label="No items available", command=lambda: var.set("No items available"))
+            labels = list(items)
+        option['values'] = ("Select Item", *(labels or ["No items available"]))
 
     def update_selected_items(self, tab_index):
         logger.debug(f"Updating selected items: tab {tab_index}")
         listbox = self.single_selected_sub_parts_listbox if tab_index == 1 else self.assembly_selected_sub_parts_listbox
         listbox.delete(0, tk.END)
         if tab_index == 1:
-            listbox.insert(tk.END, self.single_material_var.get())
-            for item_id, desc, count in self.single_selected_sub_parts:
-                listbox.insert(tk.END, f"{item_id}: {desc} ({count})" if count > 1 else f"{item_id}: {desc}")
+            rows = [self.single_material_var.get()]
+            rows.extend(self._format_sub_part(tab_index, entry) for entry in self.single_selected_sub_parts)
         else:
-            for part_id, qty in self.assembly_selected_sub_parts:
-                listbox.insert(tk.END, f"{part_id} ({qty})" if qty > 1 else part_id)
+            rows = [self._format_sub_part(tab_index, entry) for entry in self.assembly_selected_sub_parts]
+        listbox.insert(tk.END, *rows)
+
+    def _format_sub_part(self, tab_index, entry):
+        if tab_index == 1:
+            item_id, desc, count = entry
+            return f"{item_id}: {desc} ({count})" if count > 1 else f"{item_id}: {desc}"
+        return self._format_part(*entry)
+
+    def _format_part(self, part_id, quantity):
+        return f"{part_id} ({quantity})" if quantity > 1 else part_id
+
+    def _show_selected_row(self, tab_index, index, replace=False):
+        if tab_index == 1:
+            listbox, entry, row = self.single_selected_sub_parts_listbox, self.single_selected_sub_parts[index], index + 1
+        else:
+            listbox, entry, row = self.assembly_selected_sub_parts_listbox, self.assembly_selected_sub_parts[index], index
+        if replace:
+            listbox.delete(row)
+        listbox.insert(row, self._format_sub_part(tab_index, entry))
 
     def add_sub_part(self, tab_index):
         logger.debug(f"Adding sub-part: tab {tab_index}")
@@ -304,9 +420,11 @@ class SheetMetalClientHub:
                     for i, (eid, edesc, ec) in enumerate(selected_list):
                         if eid == item_id:
                             selected_list[i] = (item_id, desc, ec + count)
+                            self._show_selected_row(tab_index, i, replace=True)
                             break
                     else:
                         selected_list.append((item_id, desc, count))
+                        self._show_selected_row(tab_index, len(selected_list) - 1)
                 self.single_sub_parts_var.set("Select Item")
         else:
             selected_item = self.assembly_sub_parts_var.get()
@@ -316,21 +434,23 @@ class SheetMetalClientHub:
                 for i, (pid, pq) in enumerate(selected_list):
                     if pid == selected_item:
                         selected_list[i] = (selected_item, pq + qty)
+                        self._show_selected_row(tab_index, i, replace=True)
                         break
                 else:
                     selected_list.append((selected_item, qty))
+                    self._show_selected_row(tab_index, len(selected_list) - 1)
                 self.assembly_sub_parts_var.set("Select Item")
                 self.assembly_sub_part_quantity_var.set("1")
-        self.update_selected_items(tab_index)
 
     def clear_sub_parts(self, tab_index):
         logger.debug(f"Clearing sub-parts: tab {tab_index}")
-        fields = [(self.single_selected_sub_parts_listbox, None), (self.fastener_count_var, "0")] if tab_index == 1 else [(self.assembly_selected_sub_parts_listbox, None)]
-        self.clear_fields(fields, f"Clearing sub-parts: tab {tab_index}", f"Clear Sub-Parts Tab {tab_index}")
         if tab_index == 1:
             self.single_selected_sub_parts = []
         else:
             self.assembly_selected_sub_parts = []
+        fields = [(self.single_selected_sub_parts_listbox, None), (self.fastener_count_var, "0")] if tab_index == 1 else [(self.assembly_selected_sub_parts_listbox, None)]
+        self.clear_fields(fields, f"Clearing sub-parts: tab {tab_index}", f"Clear Sub-Parts Tab {tab_index}")
+        self.update_selected_items(tab_index)
 
     def update_quantity_dropdown(self, index, work_centre):
         logger.debug(f"Updating quantity dropdown: index {index}, work_centre {work_centre}")
@@ -346,13 +466,12 @@ class SheetMetalClientHub:
                 self.work_centre_quantity_vars[i].set(str(current_qty + 100))
                 self.work_centre_vars[index].set("")
                 qty_dropdown.grid_remove()
-                self.update_selected_items(self.notebook.index(self.notebook.select()))
+                self.update_selected_items(self.notebook.index('current'))
                 return
 
         qty_menu = qty_dropdown['menu']
         qty_menu.delete(0, tk.END)
-        if hasattr(self, f'sub_option_dropdown_{index}'):
-            getattr(self, f'sub_option_dropdown_{index}').grid_remove()
+        self.sub_option_dropdowns[index].grid_remove()
 
         if not work_centre:
             qty_dropdown.grid_remove()
@@ -360,17 +479,17 @@ class SheetMetalClientHub:
 
         qty_dropdown.grid(row=index+1, column=2, sticky="w", padx=(2, 5), pady=2)
         quantities, label = self.get_quantity_options(work_centre)
-        qty_menu.add_command(label=f"{label}: 0", command=lambda: qty_var.set("0"))
+        qty_menu.add_command(label=f"{label}: 0", command=partial(qty_var.set, "0"))
         for qty in quantities:
-            qty_menu.add_command(label=f"{label}: {qty}", command=lambda x=qty: qty_var.set(str(x)))
+            qty_menu.add_command(label=f"{label}: {qty}", command=partial(qty_var.set, str(qty)))
 
         if work_centre in ["Welding", "Coating"]:
-            sub_options = ["None", "MIG", "TIG"] if work_centre == "Welding" else ["None", "Painting", "Coating"]
-            sub_option_dropdown = tk.OptionMenu(self.operations_frame, sub_option_var, *sub_options)
-            sub_option_dropdown.grid(row=index+1, column=3, sticky="w", padx=(2, 5), pady=2)
-            setattr(self, f'sub_option_dropdown_{index}', sub_option_dropdown)
+            sub_options = ("None", "MIG", "TIG") if work_centre == "Welding" else ("None", "Painting", "Coating")
+            sub_option_dropdown = self.sub_option_dropdowns[index]
+            sub_option_dropdown['values'] = sub_options
+            sub_option_dropdown.grid()
 
-        self.update_selected_items(self.notebook.index(self.notebook.select()))
+        self.update_selected_items(self.notebook.index('current'))
 
     def get_quantity_options(self, work_centre):
         options = {
@@ -402,6 +521,7 @@ class SheetMetalClientHub:
 
     def clear_input_parameters(self):
         logger.info("Clearing input parameters")
+        self._set_status("")
         fields = [
             (self.part_id_entry, "ASSY-"), (self.revision_entry, ""),
             (self.single_material_var, "Mild Steel"), (self.single_thickness_var, "1.0"),
@@ -413,21 +533,29 @@ class SheetMetalClientHub:
             (self.assembly_custom_quantity_entry, ""), (self.assembly_selected_sub_parts_listbox, None),
             (self.assembly_sub_parts_var, "Select Item"), (self.assembly_sub_part_quantity_var, "1"),
         ] + [(v, "") for v in self.work_centre_vars] + [(v, "0") for v in self.work_centre_quantity_vars] + [(v, "None") for v in self.work_centre_sub_option_vars]
-        self.clear_fields(fields, "Clearing input parameters", "Clear Input Parameters")
+        self._suspend_traces = True
+        try:
+            self.clear_fields(fields, "Clearing input parameters", "Clear Input Parameters")
+        finally:
+            self._suspend_traces = False
+        self.single_selected_sub_parts = []
+        self.assembly_selected_sub_parts = []
+        self.update_quantity_entry_state()
+        self.update_selected_items(1)
         self.notebook.select(0)
-        for dropdown in self.quantity_dropdowns:
+        for dropdown in self.quantity_dropdowns + self.sub_option_dropdowns:
             dropdown.grid_remove()
-        for i in range(10):
-            if hasattr(self, f'sub_option_dropdown_{i}'):
-                getattr(self, f'sub_option_dropdown_{i}').grid_remove()
         for btn in [self.submit_button, self.add_another_part_button, self.add_to_parts_list_button]:
             btn.config(state='disabled')
 
     def add_part_to_list(self, part_id, quantity):
         logger.info(f"Adding part {part_id} (qty: {quantity})")
         self.added_parts.append({'part_id': part_id, 'quantity': quantity})
+        self._show_added_part(part_id, quantity)
+
+    def _show_added_part(self, part_id, quantity):
         if hasattr(self, 'parts_list_listbox') and self.parts_list_listbox.winfo_exists():
-            self.parts_list_listbox.insert(tk.END, f"{part_id} ({quantity})" if quantity > 1 else part_id)
+            self.parts_list_listbox.insert(tk.END, self._format_part(part_id, quantity))
         if len(self.added_parts) > 0 and hasattr(self, 'submit_button'):
             self.submit_button.config(state='normal')
 
@@ -454,19 +582,17 @@ class SheetMetalClientHub:
         scrollbar.grid(row=1, column=2, sticky="ns")
 
         quantity_var = tk.StringVar(value="1")
-        self.create_widget_pair(main_frame, "Quantity:", tk.OptionMenu, row=2, options=["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"], textvariable=quantity_var)
+        self.create_widget_pair(main_frame, "Quantity:", ttk.Combobox, row=2, options=SUB_PART_QUANTITIES, textvariable=quantity_var, state='readonly')
 
         def update_parts_list(event=None):
             search_term = search_var.get().lower()
             parts_listbox.delete(0, tk.END)
-            for part in load_existing_parts():
-                if search_term in part.lower():
-                    parts_listbox.insert(tk.END, part)
+            parts_listbox.insert(tk.END, *[part for part in load_existing_parts() if search_term in part.lower()])
 
         def add_selected_part():
             selection = parts_listbox.curselection()
             if not selection:
-                self.show_message("Error", "Select a part", 'error')
+                self.show_message("Error", "Select a part", 'error', modal=True)
                 return
             part_id = parts_listbox.get(selection[0])
             quantity = int(quantity_var.get())
@@ -497,16 +623,16 @@ class SheetMetalClientHub:
     def update_parts_list_display(self):
         if hasattr(self, 'parts_list_listbox') and self.parts_list_listbox.winfo_exists():
             self.parts_list_listbox.delete(0, tk.END)
-            for part in self.added_parts:
-                qty = part.get('quantity', 1)
-                self.parts_list_listbox.insert(tk.END, f"{part['part_id']} ({qty})" if qty > 1 else part['part_id'])
+            self.parts_list_listbox.insert(tk.END, *[self._format_part(part['part_id'], part.get('quantity', 1)) for part in self.added_parts])
             logger.debug("Updated parts list display")
 
     def create_part_input_screen(self):
         logger.info("Creating part input screen")
-        self.clear_screen()
-        self._create_header(self.root, "Manufacturing Input Screen")
-        main_frame = self._create_panel(self.root)
+        self._show_screen('part_input', self._build_part_input_screen, self._reset_part_input_screen)
+
+    def _build_part_input_screen(self, screen):
+        self._create_header(screen, "Manufacturing Input Screen")
+        main_frame = self._create_panel(screen)
         main_frame.grid_rowconfigure(0, weight=1)
         main_frame.grid_columnconfigure(0, weight=1)
         main_frame.grid_columnconfigure(1, weight=0)
@@ -517,7 +643,7 @@ class SheetMetalClientHub:
         left_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 5))
         input_frame = tk.Frame(left_frame, bg="#e8ecef")
         input_frame.pack(side=tk.RIGHT, padx=10, pady=5, fill=tk.BOTH, expand=True)
-        tk.Label(input_frame, text="Planned Materials", font=("Arial", 14, "bold"), bg="#e8ecef").grid(row=0, column=0, columnspan=2, pady=5)
+        tk.Label(input_frame, text="Planned Materials", font=self.font_heading, bg="#e8ecef").grid(row=0, column=0, columnspan=2, pady=5)
 
         self.part_id_entry = self.create_widget_pair(input_frame, "Part ID:", tk.Entry, row=1, default="ASSY-")
         self.revision_entry = self.create_widget_pair(input_frame, "Revision:", tk.Entry, row=2)
@@ -529,14 +655,14 @@ class SheetMetalClientHub:
         # Assembly tab
         self.assembly_part_frame = tk.Frame(self.notebook, bg="#e8ecef")
         self.notebook.add(self.assembly_part_frame, text="Assembly")
-        self.assembly_quantity_option = self.create_widget_pair(self.assembly_part_frame, "Quantity:", tk.OptionMenu, row=0, textvariable=self.assembly_quantity_var, options=["1", "5", "10", "20", "50", "100", "Other"])
+        self.assembly_quantity_option = self.create_widget_pair(self.assembly_part_frame, "Quantity:", ttk.Combobox, row=0, textvariable=self.assembly_quantity_var, options=QUANTITIES, state='readonly')
         self.assembly_custom_quantity_entry = self.create_widget_pair(self.assembly_part_frame, "", tk.Entry, row=1, state='disabled')
-        self.assembly_sub_parts_option = self.create_widget_pair(self.assembly_part_frame, "Sub-Parts:", tk.OptionMenu, row=2, textvariable=self.assembly_sub_parts_var, options=["Select Item"])
-        self.assembly_sub_part_quantity_option = self.create_widget_pair(self.assembly_part_frame, "Sub-Part Qty:", tk.OptionMenu, row=3, textvariable=self.assembly_sub_part_quantity_var, options=["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"])
+        self.assembly_sub_parts_option = self.create_widget_pair(self.assembly_part_frame, "Sub-Parts:", ttk.Combobox, row=2, textvariable=self.assembly_sub_parts_var, options=["Select Item"], state='readonly')
+        self.assembly_sub_part_quantity_option = self.create_widget_pair(self.assembly_part_frame, "Sub-Part Qty:", ttk.Combobox, row=3, textvariable=self.assembly_sub_part_quantity_var, options=SUB_PART_QUANTITIES, state='readonly')
         self._create_styled_button(self.assembly_part_frame, "Add Sub-Part", lambda: self.add_sub_part(0)).grid(row=4, column=1, sticky="w", padx=(2, 5), pady=2)
         self._create_styled_button(self.assembly_part_frame, "Clear Selected", lambda: self.clear_sub_parts(0), style='navigation').grid(row=5, column=1, sticky="w", padx=(2, 5), pady=2)
         listbox_frame = tk.Frame(self.assembly_part_frame, bg="#e8ecef")
-        self.assembly_selected_sub_parts_listbox = tk.Listbox(listbox_frame, font=("Arial", 12), height=5, width=40)
+        self.assembly_selected_sub_parts_listbox = tk.Listbox(listbox_frame, font=self.font_body, height=5, width=40)
         scrollbar = tk.Scrollbar(listbox_frame, orient=tk.VERTICAL)
         self.assembly_selected_sub_parts_listbox.config(yscrollcommand=scrollbar.set)
         scrollbar.config(command=self.assembly_selected_sub_parts_listbox.yview)
@@ -544,24 +670,29 @@ class SheetMetalClientHub:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         listbox_frame.grid(row=6, column=0, columnspan=2, sticky="w", padx=(10, 5), pady=2)
 
-        self.assembly_quantity_var.trace("w", lambda *args: self.update_quantity_entry_state())
+        self.assembly_quantity_option.bind('<<ComboboxSelected>>', self._on_quantity_selected)
 
         # Single Part tab
         self.single_part_frame = tk.Frame(self.notebook, bg="#e8ecef")
         self.notebook.add(self.single_part_frame, text="Single Part")
-        self.single_material_option = self.create_widget_pair(self.single_part_frame, "Material:", tk.OptionMenu, row=0, textvariable=self.single_material_var, options=["Mild Steel", "Aluminium", "Stainless Steel"])
-        self.single_thickness_option = self.create_widget_pair(self.single_part_frame, "Thickness (mm):", tk.OptionMenu, row=1, textvariable=self.single_thickness_var, options=["1.0", "1.2", "1.5", "2.0", "2.5", "3.0"])
-        self.single_lay_flat_length_option = self.create_widget_pair(self.single_part_frame, "Lay-Flat Length (mm):", tk.OptionMenu, row=2, textvariable=self.single_lay_flat_length_var, options=["50", "100", "500", "1000", "1500", "2000", "3000"])
-        self.single_lay_flat_width_option = self.create_widget_pair(self.single_part_frame, "Lay-Flat Width (mm):", tk.OptionMenu, row=3, textvariable=self.single_lay_flat_width_var, options=["50", "100", "500", "1000", "1500"])
-        self.single_quantity_option = self.create_widget_pair(self.single_part_frame, "Quantity:", tk.OptionMenu, row=4, textvariable=self.single_quantity_var, options=["1", "5", "10", "20", "50", "100", "Other"])
+        single_part_fields = (
+            (0, "Material:", self.single_material_var, MATERIALS),
+            (1, "Thickness (mm):", self.single_thickness_var, THICKNESSES),
+            (2, "Lay-Flat Length (mm):", self.single_lay_flat_length_var, LAY_FLAT_LENGTHS),
+            (3, "Lay-Flat Width (mm):", self.single_lay_flat_width_var, LAY_FLAT_WIDTHS),
+            (6, "Weldment Indicator:", self.single_weldment_var, WELDMENT_OPTIONS),
+        )
+        for row, label, var, options in single_part_fields:
+            self.create_widget_pair(self.single_part_frame, label, ttk.Combobox, row=row, textvariable=var, options=options, state='readonly')
+        self.single_quantity_option = self.create_widget_pair(self.single_part_frame, "Quantity:", ttk.Combobox, row=4, textvariable=self.single_quantity_var, options=QUANTITIES, state='readonly')
+        self.single_quantity_option.bind('<<ComboboxSelected>>', self._on_quantity_selected)
         self.single_custom_quantity_entry = self.create_widget_pair(self.single_part_frame, "", tk.Entry, row=5, state='disabled')
-        self.single_weldment_option = self.create_widget_pair(self.single_part_frame, "Weldment Indicator:", tk.OptionMenu, row=6, textvariable=self.single_weldment_var, options=["Yes", "No"])
-        self.single_sub_parts_option = self.create_widget_pair(self.single_part_frame, "Fasteners/Inserts:", tk.OptionMenu, row=7, textvariable=self.single_sub_parts_var, options=["Select Item"])
+        self.single_sub_parts_option = self.create_widget_pair(self.single_part_frame, "Fasteners/Inserts:", ttk.Combobox, row=7, textvariable=self.single_sub_parts_var, options=["Select Item"], state='readonly')
         self.fastener_count_entry = self.create_widget_pair(self.single_part_frame, "Fastener Count:", tk.Entry, row=8, textvariable=self.fastener_count_var)
         self._create_styled_button(self.single_part_frame, "Add Fastener/Insert", lambda: self.add_sub_part(1)).grid(row=9, column=1, sticky="w", padx=(2, 5), pady=2)
         self._create_styled_button(self.single_part_frame, "Clear Selected", lambda: self.clear_sub_parts(1), style='navigation').grid(row=10, column=1, sticky="w", padx=(2, 5), pady=2)
         listbox_frame = tk.Frame(self.single_part_frame, bg="#e8ecef")
-        self.single_selected_sub_parts_listbox = tk.Listbox(listbox_frame, font=("Arial", 12), height=5, width=40)
+        self.single_selected_sub_parts_listbox = tk.Listbox(listbox_frame, font=self.font_body, height=5, width=40)
         scrollbar = tk.Scrollbar(listbox_frame, orient=tk.VERTICAL)
         self.single_selected_sub_parts_listbox.config(yscrollcommand=scrollbar.set)
         scrollbar.config(command=self.single_selected_sub_parts_listbox.yview)
@@ -569,9 +700,8 @@ class SheetMetalClientHub:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         listbox_frame.grid(row=11, column=0, columnspan=2, sticky="w", padx=(10, 5), pady=2)
 
-        self.single_material_var.trace("w", lambda *args: self.update_selected_items(1))
-        self.single_quantity_var.trace("w", lambda *args: self.update_quantity_entry_state())
-        self.fastener_count_var.trace("w", lambda *args: self.update_selected_items(1))
+        self.single_material_var.trace_add('write', self._on_single_items_changed)
+        self.fastener_count_var.trace_add('write', self._on_single_items_changed)
 
         # Separator
         separator = ttk.Separator(main_frame, orient='vertical')
@@ -582,19 +712,24 @@ class SheetMetalClientHub:
         right_frame.grid(row=0, column=2, sticky="nsew", padx=(5, 0))
         self.operations_frame = tk.Frame(right_frame, bg="#e8ecef")
         self.operations_frame.pack(side=tk.LEFT, padx=10, pady=5, fill=tk.BOTH, expand=True)
-        tk.Label(self.operations_frame, text="Planned Operations", font=("Arial", 14, "bold"), bg="#e8ecef").grid(row=0, column=0, columnspan=4, pady=5)
+        tk.Label(self.operations_frame, text="Planned Operations", font=self.font_heading, bg="#e8ecef").grid(row=0, column=0, columnspan=4, pady=5)
 
-        work_centres = ["", "Cutting", "Bending", "Welding", "Assembly", "Finishing", "Drilling", "Punching", "Grinding", "Coating", "Inspection"]
         self.quantity_dropdowns = []
+        self.sub_option_dropdowns = []
         for i in range(10):
-            tk.Label(self.operations_frame, text=f"Operation {(i+1)*10}:", font=("Arial", 10), bg="#e8ecef").grid(row=i+1, column=0, sticky="w", padx=(5, 2), pady=2)
-            dropdown = tk.OptionMenu(self.operations_frame, self.work_centre_vars[i], *work_centres, command=lambda wc, idx=i: self.update_quantity_dropdown(idx, wc))
+            tk.Label(self.operations_frame, text=f"Operation {(i+1)*10}:", font=self.font_small, bg="#e8ecef").grid(row=i+1, column=0, sticky="w", padx=(5, 2), pady=2)
+            dropdown = ttk.Combobox(self.operations_frame, textvariable=self.work_centre_vars[i], values=WORK_CENTRES, state='readonly', width=12)
+            dropdown.bind('<<ComboboxSelected>>', lambda event, idx=i: self.update_quantity_dropdown(idx, self.work_centre_vars[idx].get()))
             dropdown.grid(row=i+1, column=1, sticky="w", padx=(2, 5), pady=2)
             qty_dropdown = tk.OptionMenu(self.operations_frame, self.work_centre_quantity_vars[i], "0")
             qty_dropdown.grid_remove()
             self.quantity_dropdowns.append(qty_dropdown)
+            sub_option_dropdown = ttk.Combobox(self.operations_frame, textvariable=self.work_centre_sub_option_vars[i], state='readonly', width=10)
+            sub_option_dropdown.grid(row=i+1, column=3, sticky="w", padx=(2, 5), pady=2)
+            sub_option_dropdown.grid_remove()
+            self.sub_option_dropdowns.append(sub_option_dropdown)
 
-        self.calculate_cost_button = self._create_styled_button(self.operations_frame, "Calculate Cost & Add Part", self.calculate_and_save, width=20)
+        self.calculate_cost_button = self._create_styled_button(self.operations_frame, "Calculate Cost & Add Part", self.calculate_and_save, width=20, disable_while_running=True)
         self.calculate_cost_button.grid(row=11, column=0, columnspan=4, pady=5)
 
         buttons_subframe = tk.Frame(self.operations_frame, bg="#e8ecef")
@@ -611,7 +746,7 @@ class SheetMetalClientHub:
         self.submit_button.config(state='disabled')
 
         parts_list_frame = tk.Frame(self.operations_frame, bg="#e8ecef")
-        self.parts_list_listbox = tk.Listbox(parts_list_frame, font=("Arial", 10), height=5, width=40)
+        self.parts_list_listbox = tk.Listbox(parts_list_frame, font=self.font_small, height=5, width=40)
         scrollbar = tk.Scrollbar(parts_list_frame, orient=tk.VERTICAL)
         self.parts_list_listbox.config(yscrollcommand=scrollbar.set)
         scrollbar.config(command=self.parts_list_listbox.yview)
@@ -626,77 +761,119 @@ class SheetMetalClientHub:
         self.settings_button.pack(side=tk.LEFT, padx=10)
         self.back_button.pack(side=tk.LEFT, padx=10)
 
-        self.create_footer()
         self.update_sub_parts_dropdown(0)
         self.update_sub_parts_dropdown(1)
+        self.update_selected_items(1)
         self.update_parts_list_display()
 
+    def _reset_part_input_screen(self):
+        self.clear_input_parameters()
+        self.add_to_parts_list_button.config(state='normal')
+        self.update_sub_parts_dropdown(0)
+        self.update_sub_parts_dropdown(1)
+        self.update_parts_list_display()
+        if self.added_parts:
+            self.submit_button.config(state='normal')
+
     def on_tab_changed(self, event):
         logger.debug("Tab changed")
-        selected_tab = self.notebook.index(self.notebook.select())
+        selected_tab = self.notebook.index('current')
         self.update_sub_parts_dropdown(selected_tab)
         self.part_id_entry.delete(0, tk.END)
         self.part_id_entry.insert(0, "ASSY-" if selected_tab == 0 else "PART-")
         self.update_selected_items(selected_tab)
 
-    @handle_errors("FR3-FR4-FR5: Cost calculation", lambda self: f"Part Type: {'Single Part' if self.notebook.index(self.notebook.select()) == 1 else 'Assembly'}, Part ID: {self.part_id_entry.get().strip()}")
+    @handle_errors("FR3-FR4-FR5: Cost calculation", lambda self: f"Part Type: {'Single Part' if self.notebook.index('current') == 1 else 'Assembly'}, Part ID: {self.part_id_entry.get().strip()}", report_success=False)
     def calculate_and_save(self):
         logger.info("Calculating part specs")
-        selected_tab = self.notebook.index(self.notebook.select())
-        part_type = "Single Part" if selected_tab == 1 else "Assembly"
+        if self.notebook.index('current') == 1:
+            part_type, read_specs = "Single Part", self._read_single_part_specs
+        else:
+            part_type, read_specs = "Assembly", self._read_assembly_specs
         part_id = self.part_id_entry.get().strip()
         revision = self.revision_entry.get().strip()
-
-        specs = {
-            'material': self.single_material_var.get() if selected_tab == 1 else "N/A",
-            'thickness': float(self.single_thickness_var.get()) if selected_tab == 1 else 0.0,
-            'length': int(self.single_lay_flat_length_var.get()) if selected_tab == 1 else 0,
-            'width': int(self.single_lay_flat_width_var.get()) if selected_tab == 1 else 0,
-            'quantity': int(self.single_custom_quantity_entry.get().strip() if self.single_quantity_var.get() == "Other" else self.single_quantity_var.get()) if selected_tab == 1 else int(self.assembly_custom_quantity_entry.get().strip() if self.assembly_quantity_var.get() == "Other" else self.assembly_quantity_var.get()),
-            'weldment_indicator': self.single_weldment_var.get() if selected_tab == 1 else "No",
-            'sub_parts': self.single_selected_sub_parts if selected_tab == 1 else self.assembly_selected_sub_parts,
-            'fastener_types_and_counts': [],
-            'top_level_assembly': "N/A" if selected_tab == 1 else part_id
-        }
+        specs = read_specs(part_id)
 
         work_centres = []
-        for i, (wc, qty, sub) in enumerate(zip(self.work_centre_vars, self.work_centre_quantity_vars, self.work_centre_sub_option_vars)):
-            if wc.get():
-                if qty.get() == "0":
-                    raise ValueError(f"Quantity for {wc.get()} in Operation {(i+1)*10} required")
-                if wc.get() in ["Welding", "Coating"] and sub.get() == "None":
-                    raise ValueError(f"{'Weld type' if wc.get() == 'Welding' else 'Surface treatment type'} required for {wc.get()}")
-                work_centres.append((wc.get(), float(qty.get()), sub.get()))
+        for i, (wc_var, qty_var, sub_var) in enumerate(zip(self.work_centre_vars, self.work_centre_quantity_vars, self.work_centre_sub_option_vars)):
+            wc = wc_var.get()
+            if not wc:
+                continue
+            qty, sub = qty_var.get(), sub_var.get()
+            if qty == "0":
+                raise ValueError(f"Quantity for {wc} in Operation {(i+1)*10} required")
+            if wc in ("Welding", "Coating") and sub == "None":
+                raise ValueError(f"{'Weld type' if wc == 'Welding' else 'Surface treatment type'} required for {wc}")
+            work_centres.append((wc, float(qty), sub))
 
         part_specs = {'part_type': part_type, 'part_id': part_id, 'revision': revision, 'specs': specs, 'work_centres': work_centres}
-        rates = self.file_handler.load_rates()
-        total_cost = calculate_and_save(part_specs, self.file_handler, rates, self.added_parts, self.show_message)
+        # calculate_and_save records the part in added_parts itself, so only the listbox is updated here
+        total_cost = calculate_and_save(part_specs, self.file_handler, self.file_handler.load_rates(), self.added_parts, self.show_message)
+        self._show_added_part(part_id, specs['quantity'])
         self.submit_button.config(state='normal')
         self.add_another_part_button.config(state='normal')
         self.add_to_parts_list_button.config(state='normal')
         self.last_part_id = part_id
         self.last_total_cost = total_cost
-        self.add_part_to_list(part_id, specs['quantity'])
+
+    def _read_quantity(self, quantity_var, custom_quantity_entry):
+        quantity = quantity_var.get()
+        if quantity == "Other":
+            quantity = custom_quantity_entry.get().strip()
+        return self._parse_number(quantity, int, "Quantity")
+
+    def _read_single_part_specs(self, part_id):
+        return {
+            'material': self.single_material_var.get(),
+            'thickness': self._parse_number(self.single_thickness_var.get(), float, "Thickness"),
+            'length': self._parse_number(self.single_lay_flat_length_var.get(), int, "Lay-Flat length"),
+            'width': self._parse_number(self.single_lay_flat_width_var.get(), int, "Lay-Flat width"),
+            'quantity': self._read_quantity(self.single_quantity_var, self.single_custom_quantity_entry),
+            'weldment_indicator': self.single_weldment_var.get(),
+            'sub_parts': self.single_selected_sub_parts,
+            'fastener_types_and_counts': [],
+            'top_level_assembly': "N/A"
+        }
+
+    def _read_assembly_specs(self, part_id):
+        return {
+            'material': "N/A", 'thickness': 0.0, 'length': 0, 'width': 0,
+            'quantity': self._read_quantity(self.assembly_quantity_var, self.assembly_custom_quantity_entry),
+            'weldment_indicator': "No",
+            'sub_parts': self.assembly_selected_sub_parts,
+            'fastener_types_and_counts': [],
+            'top_level_assembly': part_id
+        }
+
+    def _parse_number(self, value, cast, field):
+        try:
+            return cast(value)
+        except ValueError:
+            logger.error(f"Invalid {field}: {value!r}")
+            raise ValueError(f"{field} must be a valid {'whole number' if cast is int else 'number'}")
 
     def create_quote_screen(self):
         logger.info("Creating quote screen")
-        self.clear_screen()
-        self._create_header(self.root, "Generate Quote")
-        main_frame = self._create_panel(self.root)
+        self._show_screen('quote', self._build_quote_screen, self._reset_quote_screen)
+        self._populate_quote_table()
+
+    def _build_quote_screen(self, screen):
+        self._create_header(screen, "Generate Quote")
+        main_frame = self._create_panel(screen)
         self.customer_entry = self.create_widget_pair(main_frame, "Customer Name:", tk.Entry, row=0)
         self.margin_entry = self.create_widget_pair(main_frame, "Profit Margin (%):", tk.Entry, row=1)
-        self._create_styled_button(main_frame, "Generate Quote", self.generate_quote).grid(row=2, column=0, columnspan=2, pady=10)
+        self._create_styled_button(main_frame, "Generate Quote", self.generate_quote, disable_while_running=True).grid(row=2, column=0, columnspan=2, pady=10)
 
         table_frame = tk.Frame(main_frame, bg="#e8ecef")
         table_frame.grid(row=3, column=0, columnspan=2, padx=10, pady=(10, 20), sticky="ew")
-        tk.Label(table_frame, text="Parts Summary", font=("Arial", 12, "bold"), bg="#e8ecef").pack(pady=(0, 5))
+        tk.Label(table_frame, text="Parts Summary", font=self.font_bold, bg="#e8ecef").pack(pady=(0, 5))
 
         style = ttk.Style()
-        style.configure("Quote.Treeview", font=("Arial", 12), rowheight=25)
-        style.configure("Quote.Treeview.Heading", font=("Arial", 12, "bold"))
+        style.configure("Quote.Treeview", font=self.font_body, rowheight=25)
+        style.configure("Quote.Treeview.Heading", font=self.font_bold)
 
         columns = ("Part ID", "Quantity", "Unit Cost", "Total Cost")
-        tree = ttk.Treeview(table_frame, columns=columns, show="headings", style="Quote.Treeview", height=10)
+        self.quote_tree = tree = ttk.Treeview(table_frame, columns=columns, show="headings", style="Quote.Treeview", height=10)
         for col in columns:
             tree.heading(col, text=col)
         tree.column("Part ID", width=200, anchor="w")
@@ -709,6 +886,15 @@ class SheetMetalClientHub:
         tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+        self.quote_total_label = tk.Label(table_frame, font=self.font_bold, bg="#e8ecef")
+        self.quote_total_label.pack(pady=(5, 0))
+
+    def _reset_quote_screen(self):
+        self.clear_fields([(self.customer_entry, ""), (self.margin_entry, "")], "Resetting quote screen", "FR7")
+
+    def _populate_quote_table(self):
+        logger.debug("Populating quote table")
+        self.quote_tree.delete(*self.quote_tree.get_children())
         total_sum = 0.0
         for part in self.added_parts:
             part_id = part['part_id']
@@ -718,26 +904,30 @@ class SheetMetalClientHub:
                 raise ValueError(f"Cost not found for part {part_id}")
             total_cost = unit_cost * quantity
             total_sum += total_cost
-            tree.insert("", tk.END, values=(part_id, quantity, f"{unit_cost:.2f}", f"{total_cost:.2f}"))
-
-        tk.Label(table_frame, text=f"Total: £{total_sum:.2f}", font=("Arial", 12, "bold"), bg="#e8ecef").pack(pady=(5, 0))
-        self.create_footer()
+            self.quote_tree.insert("", tk.END, values=(part_id, quantity, f"{unit_cost:.2f}", f"{total_cost:.2f}"))
+        self.quote_total_label.config(text=f"Total: £{total_sum:.2f}")
 
-    @handle_errors("FR7: Generate quote", lambda self: f"Customer: {getattr(self, 'customer_entry', {'get': lambda: ''}).get().strip()}")
+    @handle_errors("FR7: Generate quote", lambda self: f"Customer: {getattr(self, 'customer_entry', {'get': lambda: ''}).get().strip()}", report_success=False)
     def generate_quote(self):
         logger.info("Generating quote")
         customer_name = self.customer_entry.get().strip()
         profit_margin = self.margin_entry.get().strip()
-        generate_quote(customer_name, profit_margin, self.added_parts, self.file_handler, self.show_message)
-        self.root.update()
+        messages = []
+        generate_quote(customer_name, profit_margin, self.added_parts, self.file_handler, lambda *message: messages.append(message))
         self.create_part_input_screen()
         self.clear_parts_list()
+        # Shown once back on part input, since switching screens clears the status line
+        for message in messages:
+            self.show_message(*message)
+        self.root.update_idletasks()
 
     def create_admin_screen(self):
         logger.info("Creating admin screen")
-        self.clear_screen()
-        self._create_header(self.root, "Admin Settings")
-        main_frame = self._create_panel(self.root)
+        self._show_screen('admin', self._build_admin_screen, self._reset_admin_screen)
+
+    def _build_admin_screen(self, screen):
+        self._create_header(screen, "Admin Settings")
+        main_frame = self._create_panel(screen)
         main_frame.grid_columnconfigure(0, weight=1)
         main_frame.grid_columnconfigure(1, weight=1)
         main_frame.grid_rowconfigure(0, weight=1)
@@ -745,82 +935,85 @@ class SheetMetalClientHub:
         # Rate Management
         rate_frame = tk.Frame(main_frame, bg="#e8ecef", bd=1, relief=tk.SOLID)
         rate_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 10), pady=10)
-        tk.Label(rate_frame, text="Rate Management", font=("Arial", 14, "bold"), bg="#e8ecef").grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
+        tk.Label(rate_frame, text="Rate Management", font=self.font_heading, bg="#e8ecef").grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
 
-        self.rate_key_var = tk.StringVar(value="Select Rate Key")
-        try:
-            rates = self.file_handler.load_rates()
-            rate_keys = list(rates.keys())
-        except ValueError as e:
-            self.show_message("Error", f"Failed to load rates: {str(e)}", 'error')
-            rate_keys = []
-            logger.error(f"Rate load error: {e}")
-        rate_key_dropdown = self.create_widget_pair(rate_frame, "Rate Key:", tk.OptionMenu, row=1, col=0, options=["Select Rate Key"] + rate_keys, textvariable=self.rate_key_var)
-        self._create_styled_button(rate_frame, "Update Rate", self.update_rate).grid(row=1, column=2, padx=5, pady=5)
-
-        self.rate_value_var = tk.StringVar()
-        self.rate_sub_value_var = tk.StringVar()
-        self.rate_value_frame = tk.Frame(rate_frame, bg="#e8ecef")
-        self.rate_value_frame.grid(row=2, column=0, columnspan=3, sticky="ew", padx=10, pady=5)
+        rate_keys = self._load_admin_rates()
+        self.rate_key_dropdown = self.create_widget_pair(rate_frame, "Rate Key:", ttk.Combobox, row=1, col=0, options=["Select Rate Key"] + rate_keys, textvariable=self.rate_key_var, state='readonly')
+        self._create_styled_button(rate_frame, "Update Rate", self.update_rate, disable_while_running=True).grid(row=1, column=2, padx=5, pady=5)
 
-        def update_rate_fields(*args):
-            logger.debug("Updating rate fields")
-            for widget in self.rate_value_frame.winfo_children():
-                widget.destroy()
-            rate_key = self.rate_key_var.get()
-            if rate_key not in rates:
-                return
-            config = rates[rate_key]
-            rate_type = config.get('type', 'simple')
-            unit = config.get('unit', '£/unit')
-            self.create_widget_pair(self.rate_value_frame, f"Rate Value ({unit}):", tk.Entry, row=0, col=0, textvariable=self.rate_value_var)
-            if rate_type == 'hourly' and 'sub_field' in config:
-                self.create_widget_pair(self.rate_value_frame, f"{config['sub_field']}:", tk.Entry, row=1, col=0, textvariable=self.rate_sub_value_var)
+        self.rate_frame = rate_frame
+        self.rate_value_frame = None
 
-        self.rate_key_var.trace("w", update_rate_fields)
-        update_rate_fields()
+        self.rate_key_var.trace_add('write', self._update_rate_fields)
+        self._update_rate_fields()
 
         # User Management
         user_frame = tk.Frame(main_frame, bg="#e8ecef", bd=1, relief=tk.SOLID)
         user_frame.grid(row=0, column=1, sticky="nsew", padx=(10, 0), pady=10)
-        tk.Label(user_frame, text="User Management", font=("Arial", 14, "bold"), bg="#e8ecef").grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
+        tk.Label(user_frame, text="User Management", font=self.font_heading, bg="#e8ecef").grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 5))
 
-        self.new_username_var = tk.StringVar()
-        self.new_password_var = tk.StringVar()
-        self.new_role_var = tk.StringVar(value="User")
-        self.create_widget_pair(user_frame, "Role:", tk.OptionMenu, row=1, col=0, options=["User", "Admin"], textvariable=self.new_role_var)
+        self.create_widget_pair(user_frame, "Role:", ttk.Combobox, row=1, col=0, options=ROLES, textvariable=self.new_role_var, state='readonly')
         self.create_widget_pair(user_frame, "New Username:", tk.Entry, row=2, col=0, textvariable=self.new_username_var)
         self.create_widget_pair(user_frame, "New Password:", tk.Entry, row=3, col=0, textvariable=self.new_password_var).config(show="*")
         self._create_styled_button(user_frame, "Create User", self.create_user).grid(row=1, column=2, padx=5, pady=5)
 
-        self.edit_username_var = tk.StringVar(value="Select User")
         users = self.file_handler.get_all_usernames()
-        self.edit_user_dropdown = self.create_widget_pair(user_frame, "Edit User:", tk.OptionMenu, row=4, col=0, options=["Select User"] + users, textvariable=self.edit_username_var)
+        self.edit_user_dropdown = self.create_widget_pair(user_frame, "Edit User:", ttk.Combobox, row=4, col=0, options=["Select User"] + users, textvariable=self.edit_username_var, state='readonly')
         self._create_styled_button(user_frame, "Edit User", self.edit_user, style='edit').grid(row=4, column=2, padx=5, pady=5)
 
-        self.remove_username_var = tk.StringVar(value="Select User")
-        self.remove_user_dropdown = self.create_widget_pair(user_frame, "Remove User:", tk.OptionMenu, row=5, col=0, options=["Select User"] + users, textvariable=self.remove_username_var)
+        self.remove_user_dropdown = self.create_widget_pair(user_frame, "Remove User:", ttk.Combobox, row=5, col=0, options=["Select User"] + users, textvariable=self.remove_username_var, state='readonly')
         self._create_styled_button(user_frame, "Remove User", self.remove_user, style='destructive').grid(row=5, column=2, padx=5, pady=5)
 
-        def update_user_dropdowns(*args):
-            logger.debug("Updating user dropdowns")
-            users = self.file_handler.get_all_usernames()
-            for var, dropdown in [(self.edit_username_var, self.edit_user_dropdown), (self.remove_username_var, self.remove_user_dropdown)]:
-                var.set("Select User")
-                menu = dropdown['menu']
-                menu.delete(0, tk.END)
-                menu.add_command(label="Select User", command=lambda v=var: v.set("Select User"))
-                for user in users:
-                    menu.add_command(label=user, command=lambda u=user, v=var: v.set(u))
-
-        self.new_username_var.trace("w", update_user_dropdowns)
-        nav_frame = tk.Frame(self.root, bg="#e8ecef")
+        self.new_username_var.trace_add('write', self._update_user_dropdowns)
+        nav_frame = tk.Frame(screen, bg="#e8ecef")
         nav_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=5)
         self._create_styled_button(nav_frame, "User Features", self.create_part_input_screen, style='navigation').pack(side=tk.LEFT, padx=10)
         self._create_styled_button(nav_frame, "Back to Login", self.go_back_to_login, style='navigation').pack(side=tk.LEFT, padx=10)
-        self.create_footer()
 
-    @handle_errors("Create User", lambda self: f"Username: {self.new_username_var.get().strip()}")
+    def _reset_admin_screen(self):
+        logger.debug("Resetting admin screen")
+        rate_keys = self._load_admin_rates()
+        self.rate_key_dropdown['values'] = ("Select Rate Key", *rate_keys)
+        self.rate_key_var.set("Select Rate Key")
+        self.rate_value_var.set("")
+        self.rate_sub_value_var.set("")
+        self.new_username_var.set("")
+        self.new_password_var.set("")
+        self.new_role_var.set("User")
+
+    def _load_admin_rates(self):
+        try:
+            self._admin_rates = self.file_handler.load_rates()
+        except ValueError as e:
+            self.show_message("Error", f"Failed to load rates: {str(e)}", 'error')
+            self._admin_rates = {}
+            logger.error(f"Rate load error: {e}")
+        return list(self._admin_rates.keys())
+
+    def _update_rate_fields(self, *args):
+        logger.debug("Updating rate fields")
+        if self.rate_value_frame is not None:
+            self.rate_value_frame.destroy()
+        self.rate_value_frame = tk.Frame(self.rate_frame, bg="#e8ecef")
+        self.rate_value_frame.grid(row=2, column=0, columnspan=3, sticky="ew", padx=10, pady=5)
+        rate_key = self.rate_key_var.get()
+        if rate_key not in self._admin_rates:
+            return
+        config = self._admin_rates[rate_key]
+        rate_type = config.get('type', 'simple')
+        unit = config.get('unit', '£/unit')
+        self.create_widget_pair(self.rate_value_frame, f"Rate Value ({unit}):", tk.Entry, row=0, col=0, textvariable=self.rate_value_var)
+        if rate_type == 'hourly' and 'sub_field' in config:
+            self.create_widget_pair(self.rate_value_frame, f"{config['sub_field']}:", tk.Entry, row=1, col=0, textvariable=self.rate_sub_value_var)
+
+    def _update_user_dropdowns(self, *args):
+        logger.debug("Updating user dropdowns")
+        users = self.file_handler.get_all_usernames()
+        for var, dropdown in [(self.edit_username_var, self.edit_user_dropdown), (self.remove_username_var, self.remove_user_dropdown)]:
+            var.set("Select User")
+            dropdown['values'] = ("Select User", *users)
+
+    @handle_errors("Create User", lambda self: f"Username: {self.new_username_var.get().strip()}", report_success=False)
     def create_user(self):
         logger.info("Creating user")
         username = self.new_username_var.get().strip()
@@ -831,14 +1024,14 @@ class SheetMetalClientHub:
         self.new_password_var.set("")
         self.new_role_var.set("User")
 
-    @handle_errors("Remove User", lambda self: f"Username: {self.remove_username_var.get().strip()}")
+    @handle_errors("Remove User", lambda self: f"Username: {self.remove_username_var.get().strip()}", report_success=False)
     def remove_user(self):
         logger.info("Removing user")
         username = self.remove_username_var.get().strip()
         remove_user(username, self.file_handler, self.show_message)
         self.remove_username_var.set("Select User")
 
-    @handle_errors("FR6: Update rate", lambda self: f"Rate Key: {self.rate_key_var.get()}")
+    @handle_errors("FR6: Update rate", lambda self: f"Rate Key: {self.rate_key_var.get()}", report_success=False)
     def update_rate(self):
         logger.info("Updating rate")
         rate_key = self.rate_key_var.get()
@@ -848,7 +1041,7 @@ class SheetMetalClientHub:
         self.rate_value_var.set("")
         self.rate_sub_value_var.set("")
 
-    @handle_errors("Edit User", lambda self: f"Username: {self.edit_username_var.get().strip()}")
+    @handle_errors("Edit User", lambda self: f"Username: {self.edit_username_var.get().strip()}", report_success=False)
     def edit_user(self):
         logger.info("Attempting to edit user")
         username = self.edit_username_var.get().strip()
@@ -861,11 +1054,18 @@ class SheetMetalClientHub:
 
     def clear_screen(self):
         logger.debug("Clearing screen")
-        for widget in self.root.winfo_children():
-            try:
-                widget.destroy()
-            except tk.TclError as e:
-                logger.warning(f"Error destroying widget: {e}")
-        for attr in ['parts_list_listbox', 'submit_button']:
-            if hasattr(self, attr):
-                delattr(self, attr)
\ No newline at end of file
+        if self._current_screen is not None:
+            self._current_screen.pack_forget()
+            self._current_screen = None
+            self._set_status("")
+
+    def _show_screen(self, name, build, reset):
+        self.clear_screen()
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._screens[name] = tk.Frame(self.root)
+            build(screen)
+        else:
+            reset()
+        screen.pack(fill=tk.BOTH, expand=True)
+        self._current_screen = screen
\ No newline at end of file
@@ -1,19 +1,51 @@
+import atexit
 import logging
+import queue
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from logging_config import setup_logger
 
 # Set up logging
 logger = setup_logger('logger', 'logger.log')
 
+class _DeferredQueueHandler(QueueHandler):
+    """
+    Queue records as they are, leaving message formatting to the listener thread.
+    """
+    def prepare(self, record):
+        return record
+
+# Records are handed to a background listener so formatting and file writes never block a Tk event handler.
+# The listener batches file writes through a MemoryHandler; errors are written straight away.
+_log_queue = queue.Queue()
+_handlers = [
+    MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=handler) if isinstance(handler, logging.FileHandler) else handler
+    for handler in logger.handlers
+]
+_listener = QueueListener(_log_queue, *_handlers, respect_handler_level=True)
+logger.handlers = [_DeferredQueueHandler(_log_queue)]
+_listener.start()
+
+def flush_logs():
+    """
+    Write out any buffered log records.
+    """
+    for handler in _handlers:
+        if isinstance(handler, MemoryHandler):
+            handler.flush()
+
+# Only drains the queue; logging's own exit hook then flushes and closes the handlers
+atexit.register(_listener.stop)
+
 def log_message(title, message, level='info'):
     """
     Log a message with the specified title and level.
     """
-    logger.log(logging.INFO if level == 'info' else logging.ERROR, f"{title}: {message}")
-    logger.debug(f"Logged message: {title} - {message} (level={level})")
+    logger.log(logging.INFO if level == 'info' else logging.ERROR, "%s: %s", title, message)
+    logger.debug("Logged message: %s - %s (level=%s)", title, message, level)
 
 def log_test_result(test_case, input_data, output, pass_fail):
     """
     Log the result of a test case.
     """
-    logger.info(f"Test Case: {test_case}, Input: {input_data}, Output: {output}, Result: {pass_fail}")
-    logger.debug(f"Test result logged: {test_case} - {pass_fail}")
\ No newline at end of file
+    logger.info("Test Case: %s, Input: %s, Output: %s, Result: %s", test_case, input_data, output, pass_fail)
+    logger.debug("Test result logged: %s - %s", test_case, pass_fail)
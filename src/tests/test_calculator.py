@@ -18,4 +18,17 @@ class TestCalculator(unittest.TestCase):
             "work_centres": [("Cutting", 100, "None")]
         }
         result = calculate_cost(part_specs, mock_rates)
-        self.assertAlmostEqual(result, 750.3, places=2)
\ No newline at end of file
+        self.assertAlmostEqual(result, 750.3, places=2)
+
+    def test_cost_hourly_rate(self):
+        mock_rates = {
+            "bending_rate": {"value": 30.0, "type": "hourly", "sub_field": "bends/hour", "sub_value": 60.0}
+        }
+        part_specs = {
+            "part_id": "ASSY-12345",
+            "part_type": "Assembly",
+            "quantity": 2,
+            "work_centres": [("Bending", 10.0, "None")]
+        }
+        result = calculate_cost(part_specs, mock_rates)
+        self.assertAlmostEqual(result, 10.0, places=2)
@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import patch, MagicMock
-from logic import calculate_and_save
+from logic import calculate_and_save, _numeric_field, _valid_part_id
 
 class TestLogic(unittest.TestCase):
     @patch('file_handler.FileHandler')
@@ -29,4 +29,72 @@ class TestLogic(unittest.TestCase):
             "work_centres": [("Cutting", 100, "None")]
         }
         result = calculate_and_save(part_specs, mock_file_handler, mock_rates, [], lambda x, y, z: None)
-        self.assertIsInstance(result, float)
\ No newline at end of file
+        self.assertIsInstance(result, float)
+
+    @patch('logic.load_existing_parts_set', return_value=frozenset({"PART-44444"}))
+    @patch('file_handler.FileHandler')
+    def test_calculate_and_save_assembly(self, mock_file_handler, mock_existing_parts):
+        mock_rates = {"assembly_rate": {"value": 2.0, "type": "simple"}}
+        part_specs = {
+            "part_type": "Assembly",
+            "part_id": "ASSY-12345",
+            "revision": "A",
+            "specs": {
+                "material": "N/A",
+                "thickness": 0.0,
+                "length": 0,
+                "width": 0,
+                "quantity": 2,
+                "sub_parts": [("PART-44444", 2)],
+                "fastener_types_and_counts": [],
+                "top_level_assembly": "ASSY-12345",
+                "weldment_indicator": "No"
+            },
+            "work_centres": [("Assembly", 2.0, "None")]
+        }
+        result = calculate_and_save(part_specs, mock_file_handler, mock_rates, [], lambda x, y, z: None)
+        self.assertAlmostEqual(result, 8.0)
+
+    def test_valid_part_id(self):
+        self.assertTrue(_valid_part_id("PART-12345", "PART-"))
+        self.assertTrue(_valid_part_id("ASSY-ABCDE12345abcde", "ASSY-"))
+        self.assertFalse(_valid_part_id("PART-1234", "PART-"))
+        self.assertFalse(_valid_part_id("PART-1234567890123456", "PART-"))
+        self.assertFalse(_valid_part_id("ASSY-12345", "PART-"))
+        self.assertFalse(_valid_part_id("PART-123_45", "PART-"))
+        self.assertFalse(_valid_part_id("PART-12345\n", "PART-"))
+        self.assertFalse(_valid_part_id("PART-1234\u00e9", "PART-"))
+
+    def test_calculate_and_save_out_of_range(self):
+        file_handler = MagicMock()
+        for field, value, message in (
+            ("length", 49, "Lay-Flat length must be between 50 and 3000 mm"),
+            ("width", 1501, "Lay-Flat width must be between 50 and 1500 mm"),
+            ("thickness", 3.5, "Thickness must be between 1.0 and 3.0 mm"),
+            ("quantity", 0, "Quantity must be a positive integer"),
+        ):
+            specs = {
+                "material": "Mild Steel", "thickness": 1.0, "length": 1000, "width": 500, "quantity": 1,
+                "sub_parts": [], "fastener_types_and_counts": [], "top_level_assembly": "N/A", "weldment_indicator": "No"
+            }
+            specs[field] = value
+            part_specs = {"part_type": "Single Part", "part_id": "PART-12345", "revision": "A", "specs": specs, "work_centres": [("Cutting", 100, "None")]}
+            with self.subTest(field=field):
+                with self.assertRaisesRegex(ValueError, message):
+                    calculate_and_save(part_specs, file_handler, {"mild_steel_rate": {"value": 1500}}, [], lambda x, y, z: None)
+        file_handler.save_output.assert_not_called()
+
+    def test_numeric_field(self):
+        self.assertEqual(_numeric_field("12.5", "Profit margin"), 12.5)
+        self.assertEqual(_numeric_field("0", "Rate value"), 0.0)
+        for value, number in (("+5", 5.0), (" 5", 5.0), ("1e2", 100.0), ("2.5E-1", 0.25), (".5", 0.5), ("5.", 5.0)):
+            self.assertEqual(_numeric_field(value, "Rate value"), number)
+        with self.assertRaisesRegex(ValueError, "Profit margin must be a valid number"):
+            _numeric_field("ten", "Profit margin")
+        for value in ("nan", "inf", "-inf", "1e", "e3", "1_000", "0x10", ".", "", "1e400"):
+            with self.assertRaisesRegex(ValueError, "Rate value must be a valid number"):
+                _numeric_field(value, "Rate value")
+        with self.assertRaisesRegex(ValueError, "Rate value cannot be negative"):
+            _numeric_field("-1", "Rate value")
+        with self.assertRaisesRegex(ValueError, "bends/hour must be positive"):
+            _numeric_field("0", "bends/hour", positive=True)
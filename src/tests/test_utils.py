@@ -1,7 +1,27 @@
+import os
+import tempfile
 import unittest
-from utils import hash_password
+from utils import hash_password, _load_parts_catalogue, _load_catalogue_prices
 
 class TestUtils(unittest.TestCase):
     def test_hash_password(self):
         result = hash_password("moffat123")
-        self.assertEqual(result, "4b5a1911ddfde19a819157e85312b4aae8915e4968cb983e570da2e1098457e0")
\ No newline at end of file
+        self.assertEqual(result, "4b5a1911ddfde19a819157e85312b4aae8915e4968cb983e570da2e1098457e0")
+
+    def test_load_parts_catalogue_quoted_description(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'parts_catalogue.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('FAS-001,Screw M3,10.0\n\nFAS-004,"Bolt, hex M6",2.5\n')
+            result = _load_parts_catalogue(path, os.path.getmtime(path))
+        self.assertEqual(result, (('FAS-001', 'Screw M3', 10.0), ('FAS-004', 'Bolt, hex M6', 2.5)))
+
+    def test_load_catalogue_prices(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'parts_catalogue.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('FAS-001,Screw M3,10.0\nFAS-002,Nut M4,bad\nFAS-004,"Bolt, hex M6",2.5\n')
+            result = _load_catalogue_prices(path, os.path.getmtime(path))
+        self.assertEqual(dict(result), {'FAS-001': 10.0, 'FAS-004': 2.5})
+        with self.assertRaises(TypeError):
+            result['FAS-003'] = 1.0
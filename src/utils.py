@@ -1,6 +1,9 @@
+import csv
 import hashlib
 import os
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 logger = logging.getLogger('utils')
@@ -25,50 +28,89 @@ def hash_password(password):
         logger.error(f"Unexpected error in password hashing: {e}")
         return None
 
+PARTS_FILE = os.path.join(BASE_DIR, 'data', 'output.txt')
+CATALOGUE_FILE = os.path.join(BASE_DIR, 'data', 'parts_catalogue.txt')
+READ_BUFFER_SIZE = 1 << 16
+
+def file_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
 def load_existing_parts():
+    return _load_existing_parts(PARTS_FILE, file_mtime(PARTS_FILE))
+
+@lru_cache(maxsize=1)
+def _load_existing_parts(parts_file, mtime):
     try:
-        parts_file = os.path.join(BASE_DIR, 'data', 'output.txt')
         parts = []
-        with open(parts_file, 'r', encoding='utf-8') as f:
+        append = parts.append
+        with open(parts_file, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
             for line in f:
-                if line.strip():
-                    part_id = line.strip().split(',')[0]
-                    parts.append(part_id)
+                part_id = line.partition(',')[0].strip()
+                if part_id:
+                    append(part_id)
         logger.debug(f"Loaded {len(parts)} parts from {parts_file}")
-        return parts
+        return tuple(parts)
     except FileNotFoundError:
         logger.error(f"Parts file not found: {parts_file}")
-        return []
+        return ()
     except Exception as e:
         logger.error(f"Error loading parts: {e}")
-        return []
+        return ()
+
+def load_existing_parts_set():
+    return _load_existing_parts_set(PARTS_FILE, file_mtime(PARTS_FILE))
+
+@lru_cache(maxsize=1)
+def _load_existing_parts_set(parts_file, mtime):
+    return frozenset(_load_existing_parts(parts_file, mtime))
 
 def load_parts_catalogue():
+    return _load_parts_catalogue(CATALOGUE_FILE, file_mtime(CATALOGUE_FILE))
+
+@lru_cache(maxsize=1)
+def _load_parts_catalogue(catalogue_file, mtime):
     try:
-        catalogue_file = os.path.join(BASE_DIR, 'data', 'parts_catalogue.txt')
         items = []
-        with open(catalogue_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    parts = line.strip().split(',')
-                    if len(parts) >= 3:
-                        item_id, desc, price = parts[0], parts[1], parts[2]
-                        try:
-                            price = float(price)
-                            items.append((item_id, desc, price))
-                        except ValueError:
-                            logger.warning(f"Invalid price format for {item_id}: {price}")
-                            continue
-                    else:
-                        logger.warning(f"Invalid line format: {line.strip()}")
+        with open(catalogue_file, 'r', encoding='utf-8', newline='', buffering=READ_BUFFER_SIZE) as f:
+            # csv handles quoted descriptions that contain commas
+            for row in csv.reader(f):
+                if not any(field.strip() for field in row):
+                    continue
+                if len(row) >= 3:
+                    item_id, desc, price = row[0], row[1], row[2]
+                    try:
+                        price = float(price)
+                        items.append((item_id, desc, price))
+                    except ValueError:
+                        logger.warning(f"Invalid price format for {item_id}: {price}")
+                        continue
+                else:
+                    logger.warning(f"Invalid line format: {','.join(row)}")
         logger.debug(f"Loaded {len(items)} items from {catalogue_file}")
-        return items
+        return tuple(items)
     except FileNotFoundError:
         logger.error(f"Catalogue file not found: {catalogue_file}")
-        return []
+        return ()
     except Exception as e:
         logger.error(f"Error loading catalogue: {e}")
-        return []
+        return ()
+
+def load_catalogue_prices():
+    return _load_catalogue_prices(CATALOGUE_FILE, file_mtime(CATALOGUE_FILE))
+
+@lru_cache(maxsize=1)
+def _load_catalogue_prices(catalogue_file, mtime):
+    return MappingProxyType({item_id: price for item_id, _, price in _load_parts_catalogue(catalogue_file, mtime)})
+
+def invalidate_caches():
+    _load_existing_parts.cache_clear()
+    _load_existing_parts_set.cache_clear()
+    _load_parts_catalogue.cache_clear()
+    _load_catalogue_prices.cache_clear()
+    logger.debug("Cleared cached parts and catalogue")
 
 def load_part_cost(part_id):
     try:
@@ -92,12 +134,16 @@ def load_part_cost(part_id):
         logger.error(f"Error loading part cost: {e}")
         return None
 
-def handle_errors(description, input_data_func):
+def handle_errors(description, input_data_func, report_success=True):
+    # report_success=False is for actions whose logic function already shows its own success message
     def decorator(func):
         def wrapper(self, *args, **kwargs):
             try:
                 result = func(self, *args, **kwargs)
-                self.show_message("Success", f"{description} completed: {result}", 'info')
+                if report_success:
+                    self.show_message("Success", f"{description} completed: {result}", 'info')
+                else:
+                    logger.info(f"{description} completed: {result}")
                 return result
             except Exception as e:
                 output = f"{description} failed: {str(e)}"